@@ -6,15 +6,22 @@ Reads tasks from the tasks/ folder and spawns sub-agents to complete them.
 Respects dependencies and runs up to 5 tasks in parallel.
 """
 
+import asyncio
+import atexit
 import os
 import json
 import re
-import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Paths
 WORKSPACE = Path("/Users/mastercontrol/.openclaw/workspace")
 AGENT_TALK = WORKSPACE / "agent-talk"
@@ -23,43 +30,52 @@ TODOS_DIR = TASKS_DIR / "todos"
 IN_PROGRESS_DIR = TASKS_DIR / "in-progress"
 DONE_DIR = TASKS_DIR / "done"
 ORCHESTRATOR_STATE = AGENT_TALK / ".orchestrator.json"
+TASK_CACHE = AGENT_TALK / ".task_cache.json"
 LOG_FILE = AGENT_TALK / "orchestrator.log"
 
 # Max parallel agents
 MAX_PARALLEL = 5
 
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_TITLE_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+
+# Log file handle, opened once per process instead of per log() call
+_log_fh = None
+
+def _get_log_fh():
+    global _log_fh
+    if _log_fh is None:
+        _log_fh = open(LOG_FILE, "a", buffering=1)
+        atexit.register(_log_fh.close)
+    return _log_fh
+
 def log(message: str):
     """Log message with timestamp."""
     timestamp = datetime.now().isoformat()
     log_line = f"[{timestamp}] {message}"
     print(log_line)
-    with open(LOG_FILE, "a") as f:
-        f.write(log_line + "\n")
+    _get_log_fh().write(log_line + "\n")
 
 def parse_task_frontmatter(content: str) -> dict:
     """Parse YAML frontmatter from task file."""
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}
-    
-    frontmatter = {}
-    for line in match.group(1).split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            
-            # Parse lists
-            if value.startswith('[') and value.endswith(']'):
-                items = value[1:-1].split(',')
-                frontmatter[key] = [item.strip() for item in items if item.strip()]
-            elif value.lower() == 'true':
-                frontmatter[key] = True
-            elif value.lower() == 'false':
-                frontmatter[key] = False
-            else:
-                frontmatter[key] = value
-    return frontmatter
+    frontmatter = yaml.load(match.group(1), Loader=SafeLoader)
+    return frontmatter if isinstance(frontmatter, dict) else {}
+
+def _iter_md(directory: Path):
+    """Yield DirEntry objects for .md files in a directory.
+
+    os.scandir avoids the per-entry Path construction and extra stat
+    work done by Path.glob, and DirEntry.stat() is cached on Linux.
+    """
+    if not directory.is_dir():
+        return
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith('.md'):
+                yield entry
 
 def read_task(filepath: Path) -> dict:
     """Read a task file and return structured data."""
@@ -88,57 +104,208 @@ def read_task(filepath: Path) -> dict:
 
 def get_task_title(content: str) -> str:
     """Extract title from task content."""
-    match = re.search(r'^# (.+)$', content, re.MULTILINE)
+    match = _TITLE_RE.search(content)
     return match.group(1) if match else "Untitled"
 
+# Parsed-task cache, keyed by path and invalidated on (mtime_ns, size) change.
+# Loaded lazily, written back once per run at the end of main_async().
+_task_cache: Optional[dict] = None
+# Paths read this run; save_task_cache() drops everything else, since a
+# task leaves a stale entry at its old path each time it moves folders
+_task_cache_seen: set = set()
+
+def load_task_cache() -> dict:
+    """Load the parsed-task cache from disk (once per run)."""
+    global _task_cache
+    if _task_cache is None:
+        _task_cache = {}
+        if TASK_CACHE.exists():
+            try:
+                _task_cache = json.loads(TASK_CACHE.read_text())
+            except (json.JSONDecodeError, OSError):
+                pass
+    return _task_cache
+
+def save_task_cache():
+    """Write the parsed-task cache atomically (tmp + rename).
+
+    Only paths seen this run are kept, so entries for files a task used
+    to live at don't accumulate across runs.
+    """
+    if _task_cache is None:
+        return
+    pruned = {k: v for k, v in _task_cache.items() if k in _task_cache_seen}
+    tmp = TASK_CACHE.with_suffix('.json.tmp')
+    tmp.write_text(json.dumps(pruned))
+    os.replace(tmp, TASK_CACHE)
+
+def read_task_cached(filepath: Path, stat: Optional[os.stat_result] = None) -> dict:
+    """Read a task, reusing the cached parse if the file is unchanged."""
+    cache = load_task_cache()
+    if stat is None:
+        stat = filepath.stat()
+    _task_cache_seen.add(str(filepath))
+    entry = cache.get(str(filepath))
+    if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        task = dict(entry['parsed'])
+        task['filepath'] = filepath
+        return task
+    task = read_task(filepath)
+    cache[str(filepath)] = {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'parsed': {k: v for k, v in task.items() if k != 'filepath'}
+    }
+    return task
+
+# task_id -> status index, built in one pass over the three task folders
+# so status lookups are O(1) instead of a glob per call
+_status_index: Optional[dict] = None
+
+def build_status_index() -> dict:
+    """Build a task_id -> status index from one pass over the task folders."""
+    index = {}
+    for status, folder in [('todo', TODOS_DIR), ('in-progress', IN_PROGRESS_DIR), ('done', DONE_DIR)]:
+        for entry in _iter_md(folder):
+            # Files are named task-<num>-<slug>.md but ids are task-<num>;
+            # extract the id the same way as the done-folder scan
+            stem = entry.name[:-3]
+            task_id = stem.replace('task-', '').split('-')[0]
+            index[f'task-{task_id}'] = status
+    return index
+
 def get_task_status(task_id: str) -> str:
     """Check which folder a task is in."""
-    for status, folder in [('todo', TODOS_DIR), ('in-progress', IN_PROGRESS_DIR), ('done', DONE_DIR)]:
-        for f in folder.glob('*.md'):
-            if task_id in f.name:
-                return status
-    return 'unknown'
+    global _status_index
+    if _status_index is None:
+        _status_index = build_status_index()
+    return _status_index.get(task_id, 'unknown')
 
 def get_all_tasks() -> list:
     """Get all tasks from all folders."""
     tasks = []
     
     # Read todos
-    for f in TODOS_DIR.glob('*.md'):
-        task = read_task(f)
+    for entry in _iter_md(TODOS_DIR):
+        task = read_task_cached(Path(entry.path), stat=entry.stat())
         task['status'] = 'todo'
         tasks.append(task)
-    
+
     # Read in-progress
-    for f in IN_PROGRESS_DIR.glob('*.md'):
-        task = read_task(f)
+    for entry in _iter_md(IN_PROGRESS_DIR):
+        task = read_task_cached(Path(entry.path), stat=entry.stat())
         task['status'] = 'in-progress'
         tasks.append(task)
     
     return tasks
 
-def check_dependencies_met(task: dict, completed_tasks: set) -> bool:
-    """Check if all dependencies are completed."""
-    if not task.get('depends_on'):
-        return True
-    
-    for dep in task['depends_on']:
-        if dep and dep not in completed_tasks:
-            return False
-    return True
+def unmet_dep_counts(tasks: list, completed_tasks: set) -> dict:
+    """Count unmet dependencies per task (Kahn-style indegree table)."""
+    return {
+        t['id']: sum(
+            1 for dep in (t.get('depends_on') or [])
+            if dep and dep not in completed_tasks
+        )
+        for t in tasks
+    }
+
+def find_cyclic_tasks(tasks: list) -> set:
+    """Find task ids caught in dependency cycles via three-color DFS.
+
+    A cyclic task never reaches indegree zero, so without this check it
+    would silently stall across runs forever. Returns the set of ids on
+    a cycle so the scheduler can drop them with a diagnostic.
+    """
+    task_ids = {t['id'] for t in tasks}
+    deps = {
+        t['id']: [d for d in (t.get('depends_on') or []) if d in task_ids]
+        for t in tasks
+    }
+    WHITE, GRAY, BLACK = 0, 1, 2
+    color = {task_id: WHITE for task_id in deps}
+    cyclic = set()
+    path = []
+
+    def visit(task_id: str):
+        color[task_id] = GRAY
+        path.append(task_id)
+        for dep in deps[task_id]:
+            if color[dep] == GRAY:
+                cycle = path[path.index(dep):]
+                log(f"CYCLE: {' -> '.join(cycle + [dep])}")
+                cyclic.update(cycle)
+            elif color[dep] == WHITE:
+                visit(dep)
+        path.pop()
+        color[task_id] = BLACK
+
+    for task_id in deps:
+        if color[task_id] == WHITE:
+            visit(task_id)
+    return cyclic
+
+# Priority ordering for scheduling (high -> medium -> low)
+PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+def critical_path_lengths(tasks: list) -> dict:
+    """Compute the longest chain of dependents below each task.
+
+    A task with a long chain of downstream tasks is on the critical path:
+    finishing it early unblocks the most work. Uses a memoized DFS over
+    the reverse dependency graph.
+    """
+    task_ids = {t['id'] for t in tasks}
+    rdeps = {}
+    for t in tasks:
+        for dep in t.get('depends_on') or []:
+            if dep in task_ids:
+                rdeps.setdefault(dep, []).append(t['id'])
+
+    lengths = {}
 
-def spawn_agent(task: dict) -> dict:
+    def depth(task_id: str) -> int:
+        if task_id in lengths:
+            return lengths[task_id]
+        lengths[task_id] = 0  # guard: a cycle contributes nothing
+        dependents = rdeps.get(task_id)
+        if dependents:
+            lengths[task_id] = 1 + max(depth(d) for d in dependents)
+        return lengths[task_id]
+
+    for t in tasks:
+        depth(t['id'])
+    return lengths
+
+def select_ready_tasks(tasks: list, indeg: dict) -> list:
+    """Pick runnable tasks, preferring those that unblock the most work.
+
+    Ready tasks (todo status, indegree zero) form the current Kahn wave;
+    within the wave, sort by critical path length first and declared
+    priority second.
+    """
+    lengths = critical_path_lengths(tasks)
+    ready = [
+        t for t in tasks
+        if t['status'] == 'todo' and indeg[t['id']] == 0
+    ]
+    ready.sort(key=lambda t: (
+        -lengths.get(t['id'], 0),
+        PRIORITY_ORDER.get(t.get('priority', 'medium'), 1)
+    ))
+    return ready
+
+async def spawn_agent(task: dict) -> dict:
     """Spawn a sub-agent to work on a task."""
     task_id = task['id']
     task_file = task['filepath']
     
     log(f"Spawning agent for {task_id}: {task['title']}")
     
-    # Move task to in-progress
+    # Move task to in-progress - one atomic rename, since both folders
+    # live under the same workspace filesystem
     dest = IN_PROGRESS_DIR / task_file.name
     if task_file.exists():
-        import shutil
-        shutil.move(str(task_file), str(dest))
+        os.replace(task_file, dest)
         log(f"Moved {task_id} to in-progress")
     
     # Build the prompt for the sub-agent
@@ -174,16 +341,24 @@ Read the task file at the location above and complete ALL acceptance criteria.
     
     # Use sessions_spawn to create a sub-agent
     try:
-        result = subprocess.run(
-            ['openclaw', 'agent', 'spawn', '--task', prompt],
-            capture_output=True,
-            text=True,
-            timeout=30
+        proc = await asyncio.create_subprocess_exec(
+            'openclaw', 'agent', 'spawn', '--task', prompt,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
-        log(f"Spawn result: {result.stdout}")
-        if result.returncode != 0:
-            log(f"Spawn error: {result.stderr}")
-        return {'success': result.returncode == 0, 'task_id': task_id}
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            # Don't leave an orphaned child running - a later run would
+            # spawn a duplicate agent for the same task
+            proc.kill()
+            await proc.wait()
+            log(f"Spawn timed out for {task_id}, killed process")
+            return {'success': False, 'error': 'spawn timed out'}
+        log(f"Spawn result: {stdout.decode()}")
+        if proc.returncode != 0:
+            log(f"Spawn error: {stderr.decode()}")
+        return {'success': proc.returncode == 0, 'task_id': task_id}
     except Exception as e:
         log(f"Failed to spawn agent: {e}")
         return {'success': False, 'error': str(e)}
@@ -202,7 +377,7 @@ def save_orchestrator_state(state: dict):
     """Save orchestrator state."""
     ORCHESTRATOR_STATE.write_text(json.dumps(state, indent=2))
 
-def main():
+async def main_async():
     log("=" * 60)
     log("Agent-Talk Task Orchestrator Starting")
     log("=" * 60)
@@ -216,8 +391,9 @@ def main():
     completed_tasks = set(state.get('completed_tasks', []))
     
     # Also check done folder
-    for f in DONE_DIR.glob('*.md'):
-        task_id = f.stem.replace('task-', '').split('-')[0]
+    for entry in _iter_md(DONE_DIR):
+        stem = entry.name[:-3]
+        task_id = stem.replace('task-', '').split('-')[0]
         completed_tasks.add(f'task-{task_id}')
     
     # Get all pending tasks
@@ -228,18 +404,16 @@ def main():
     agent_talk_tasks = [t for t in all_tasks if t.get('project') == 'agent-talk' or 'agent-talk' in t['id']]
     log(f"Found {len(agent_talk_tasks)} agent-talk tasks")
     
-    # Find tasks ready to run (todo status, dependencies met)
-    ready_tasks = []
-    for task in agent_talk_tasks:
-        if task['status'] != 'todo':
-            continue
-        if check_dependencies_met(task, completed_tasks):
-            ready_tasks.append(task)
-    
-    # Sort by priority (high -> medium -> low)
-    priority_order = {'high': 0, 'medium': 1, 'low': 2}
-    ready_tasks.sort(key=lambda t: priority_order.get(t.get('priority', 'medium'), 1))
-    
+    # Drop tasks caught in dependency cycles - they can never run
+    cyclic = find_cyclic_tasks(agent_talk_tasks)
+    if cyclic:
+        log(f"Dropping {len(cyclic)} tasks in dependency cycles: {sorted(cyclic)}")
+        agent_talk_tasks = [t for t in agent_talk_tasks if t['id'] not in cyclic]
+
+    # Find tasks ready to run, ordered by critical path then priority
+    indeg = unmet_dep_counts(agent_talk_tasks, completed_tasks)
+    ready_tasks = select_ready_tasks(agent_talk_tasks, indeg)
+
     log(f"Found {len(ready_tasks)} tasks ready to run")
     
     # Limit to MAX_PARALLEL
@@ -247,6 +421,7 @@ def main():
     
     if not tasks_to_spawn:
         log("No tasks to spawn. All caught up!")
+        save_task_cache()
         return
     
     log(f"Spawning {len(tasks_to_spawn)} agents...")
@@ -255,9 +430,10 @@ def main():
     for i, task in enumerate(tasks_to_spawn, 1):
         log(f"  {i}. {task['id']}: {task['title']}")
     
-    # Spawn agents (they'll run asynchronously)
-    for task in tasks_to_spawn:
-        result = spawn_agent(task)
+    # Spawn agents in parallel - each spawn waits up to 30s on the
+    # subprocess, so running them serially would take O(N * spawn_latency)
+    results = await asyncio.gather(*[spawn_agent(task) for task in tasks_to_spawn])
+    for task, result in zip(tasks_to_spawn, results):
         if result.get('success'):
             state['active_agents'].append({
                 'task_id': task['id'],
@@ -267,8 +443,12 @@ def main():
     # Save state
     state['last_run'] = datetime.now().isoformat()
     save_orchestrator_state(state)
+    save_task_cache()
     
     log(f"Orchestration complete. {len(tasks_to_spawn)} agents spawned.")
 
+def main():
+    asyncio.run(main_async())
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -17,12 +17,14 @@ Example:
 """
 
 from .client import AgentTalk
+from .async_client import AsyncAgentTalk
 from .types import (
     Voice,
     Memo,
     MemoAudio,
     MemoVoice,
     CreateMemoOptions,
+    DatabaseHealth,
     HealthResponse,
     AgentTalkConfig,
 )
@@ -45,12 +47,14 @@ __version__ = "1.0.0"
 __all__ = [
     # Client
     "AgentTalk",
+    "AsyncAgentTalk",
     # Types
     "Voice",
     "Memo",
     "MemoAudio",
     "MemoVoice",
     "CreateMemoOptions",
+    "DatabaseHealth",
     "HealthResponse",
     "AgentTalkConfig",
     # Errors
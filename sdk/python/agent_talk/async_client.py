@@ -0,0 +1,370 @@
+"""
+Agent Talk SDK - Async HTTP Client
+
+Requires the optional httpx dependency: pip install agent-talk[async]
+"""
+
+import json
+import time
+from typing import Optional
+
+from .types import AgentTalkConfig, DatabaseHealth, HealthResponse
+from .errors import AgentTalkError, create_error_from_response
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency
+    httpx = None
+
+DEFAULT_BASE_URL = "https://talk.onhyper.io"
+VOICES_CACHE_TTL = 300  # seconds - voice catalog rarely changes in-process
+
+
+class AsyncHttpClient:
+    """Async HTTP Client for Agent Talk API.
+
+    Built on httpx.AsyncClient, so concurrent requests share one event
+    loop and one connection pool.
+    """
+
+    def __init__(self, config: AgentTalkConfig = None):
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for the async client. "
+                "Install it with: pip install agent-talk[async]"
+            )
+        if config is None:
+            config = AgentTalkConfig()
+        self.base_url = config.base_url or DEFAULT_BASE_URL
+        self.api_key = config.api_key
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=config.timeout or 30.0,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        )
+
+    def get_base_url(self) -> str:
+        """Get the base URL."""
+        return self.base_url
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def get(self, path: str, auth: bool = True) -> dict:
+        """Make a GET request."""
+        return await self._request("GET", path, auth=auth)
+
+    async def post(self, path: str, body: Optional[dict] = None, auth: bool = True) -> dict:
+        """Make a POST request."""
+        return await self._request("POST", path, body=body, auth=auth)
+
+    async def delete(self, path: str, auth: bool = True) -> dict:
+        """Make a DELETE request."""
+        return await self._request("DELETE", path, auth=auth)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict] = None,
+        auth: bool = True
+    ) -> dict:
+        """Make an HTTP request."""
+        headers = {}
+
+        # Add API key authentication if required and available
+        if auth and self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        try:
+            response = await self._http.request(method, path, json=body, headers=headers)
+
+        except httpx.TimeoutException:
+            raise AgentTalkError(
+                "SERVICE_UNAVAILABLE",
+                "Request timeout",
+                408
+            )
+
+        except httpx.TransportError as e:
+            # Handle network errors
+            raise AgentTalkError(
+                "SERVICE_UNAVAILABLE",
+                f"Network error: Unable to connect to Agent Talk API: {e}",
+                503
+            )
+
+        if response.status_code >= 400:
+            # Handle error response
+            try:
+                error_response = response.json()
+            except json.JSONDecodeError:
+                raise AgentTalkError(
+                    "INTERNAL_ERROR",
+                    f"HTTP {response.status_code}: {response.reason_phrase}",
+                    response.status_code
+                )
+            raise create_error_from_response(response.status_code, error_response)
+
+        if not response.content:
+            return {}
+        return response.json()
+
+
+class AsyncMemoApi:
+    """Async Memo API - Create and manage text-to-speech memos."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def create(self, text: str, voice: str) -> 'Memo':
+        """
+        Create a new memo (convert text to speech).
+
+        Requires an API key to be configured.
+
+        Args:
+            text: The text to convert to speech
+            voice: The voice ID to use (e.g., 'rachel', 'domi', 'adam')
+
+        Returns:
+            Memo: The created memo with audio URL
+
+        Raises:
+            MissingApiKeyError: If no API key is configured
+            InvalidVoiceError: If the voice ID is invalid
+            RateLimitError: If rate limit is exceeded
+
+        Example:
+            memo = await client.memo.create(
+                text="Hello from Agent Talk!",
+                voice="rachel"
+            )
+            print(f"Audio URL: {memo.audio.url}")
+        """
+        from .types import Memo
+
+        response = await self._client.post(
+            "/api/v1/memo", {"text": text, "voice": voice}, auth=True
+        )
+
+        voice_data = response["voice"]
+        audio_data = response["audio"]
+        # Positional args in Memo field order: skips kwarg binding on
+        # the per-memo hot path
+        return Memo(
+            response["id"],
+            response["text"],
+            voice_data["id"],
+            voice_data["name"],
+            voice_data["gender"],
+            voice_data["description"],
+            audio_data["url"],
+            audio_data["duration"],
+            audio_data["format"],
+            response["createdAt"]
+        )
+
+    async def demo(self, text: str, voice: str) -> 'Memo':
+        """
+        Create a demo memo (no API key required).
+
+        Uses simulation mode - audio will be silent/placeholder.
+        For production-quality audio, use create() with an API key.
+
+        Args:
+            text: The text to convert to speech
+            voice: The voice ID to use
+
+        Returns:
+            Memo: The created memo with simulated audio
+
+        Example:
+            # No API key needed for demo
+            memo = await client.memo.demo(
+                text="This is a demo!",
+                voice="rachel"
+            )
+        """
+        from .types import Memo
+
+        response = await self._client.post(
+            "/api/v1/demo", {"text": text, "voice": voice}, auth=False
+        )
+
+        voice_data = response["voice"]
+        audio_data = response["audio"]
+        # Positional args in Memo field order: skips kwarg binding on
+        # the per-memo hot path
+        return Memo(
+            response["id"],
+            response["text"],
+            voice_data["id"],
+            voice_data["name"],
+            voice_data["gender"],
+            voice_data["description"],
+            audio_data["url"],
+            audio_data["duration"],
+            audio_data["format"],
+            response["createdAt"]
+        )
+
+
+class AsyncVoicesApi:
+    """Async Voices API - List and manage available voices."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+        # (fetched_at, {voice_id: Voice}) - populated by list()
+        self._voices_cache = None
+
+    async def list(self) -> list:
+        """
+        List all available voices.
+
+        Results are cached in-process for VOICES_CACHE_TTL seconds;
+        call invalidate() to force a refetch.
+
+        Returns:
+            List[Voice]: Array of available voices
+
+        Example:
+            voices = await client.voices.list()
+            for voice in voices:
+                print(f"{voice.id}: {voice.name} - {voice.description}")
+        """
+        from .types import Voice
+
+        if (
+            self._voices_cache is not None
+            and time.monotonic() - self._voices_cache[0] < VOICES_CACHE_TTL
+        ):
+            return list(self._voices_cache[1].values())
+
+        response = await self._client.get("/api/v1/voices", auth=False)
+
+        voices = [
+            Voice(v["id"], v["name"], v["gender"], v["description"])
+            for v in response["voices"]
+        ]
+        self._voices_cache = (time.monotonic(), {v.id: v for v in voices})
+        return voices
+
+    async def get(self, voice_id: str) -> Optional['Voice']:
+        """
+        Get a voice by ID.
+
+        Served from the cached voice list when fresh, so repeated
+        lookups don't each cost a network round-trip.
+
+        Args:
+            voice_id: The voice ID to look up
+
+        Returns:
+            Voice: The voice if found, or None
+
+        Example:
+            voice = await client.voices.get("rachel")
+            if voice:
+                print(f"Found voice: {voice.name}")
+        """
+        if (
+            self._voices_cache is None
+            or time.monotonic() - self._voices_cache[0] >= VOICES_CACHE_TTL
+        ):
+            await self.list()
+        return self._voices_cache[1].get(voice_id)
+
+    def invalidate(self):
+        """Drop the cached voice list so the next call refetches."""
+        self._voices_cache = None
+
+
+class AsyncAgentTalk:
+    """
+    Async Agent Talk SDK Client.
+
+    Same API surface as AgentTalk, but every method is a coroutine, so N
+    concurrent memo creations finish in roughly one round-trip instead
+    of N.
+
+    Example:
+        import asyncio
+        from agent_talk import AsyncAgentTalk
+
+        async def main():
+            async with AsyncAgentTalk(api_key="at_live_xxx") as client:
+                memos = await asyncio.gather(
+                    client.memo.create(text="First", voice="rachel"),
+                    client.memo.create(text="Second", voice="adam"),
+                )
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Create a new async Agent Talk client.
+
+        Args:
+            api_key: API key (required for memo.create(), optional for demo/voices)
+            base_url: API base URL (default: https://talk.onhyper.io)
+            timeout: Request timeout in seconds (default: 30)
+        """
+        config = AgentTalkConfig(
+            api_key=api_key,
+            base_url=base_url or DEFAULT_BASE_URL,
+            timeout=timeout or 30.0
+        )
+        self._client = AsyncHttpClient(config)
+        # Direct attribute for hot-path callers; get_base_url() remains
+        # as a back-compat alias
+        self.base_url = self._client.base_url
+        self.memo = AsyncMemoApi(self._client)
+        self.voices = AsyncVoicesApi(self._client)
+
+    async def health(self) -> HealthResponse:
+        """
+        Check API health status.
+
+        Returns:
+            HealthResponse: Health status response
+
+        Example:
+            health = await client.health()
+            print(f"Status: {health.status}")
+        """
+        response = await self._client.get("/health", auth=False)
+
+        db = response.get("database") or {}
+        return HealthResponse(
+            response["status"],
+            response["service"],
+            response["version"],
+            response["timestamp"],
+            response["ttsMode"],
+            DatabaseHealth(db.get("status", "unknown"), db.get("latency"), db.get("error"))
+        )
+
+    def get_base_url(self) -> str:
+        """Get the base URL being used (alias for the base_url attribute)."""
+        return self.base_url
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncAgentTalk':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
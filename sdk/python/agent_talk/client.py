@@ -2,34 +2,69 @@
 Agent Talk SDK - HTTP Client
 """
 
+import http.client
 import json
-from typing import Optional, TypeVar, Type
-from dataclasses import asdict
-import urllib.request
-import urllib.error
+import socket
+import time
+from typing import Optional
+from urllib.parse import urlsplit
 
-from .types import AgentTalkConfig, HealthResponse
+from .types import AgentTalkConfig, DatabaseHealth, HealthResponse
 from .errors import AgentTalkError, create_error_from_response
 
-T = TypeVar('T')
+try:
+    # orjson emits bytes directly and parses several times faster than
+    # the stdlib; it is an optional dependency (agent-talk[speedups])
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
 
 DEFAULT_BASE_URL = "https://talk.onhyper.io"
 DEFAULT_TIMEOUT = 30  # seconds
+VOICES_CACHE_TTL = 300  # seconds - voice catalog rarely changes in-process
 
 
 class HttpClient:
-    """HTTP Client for Agent Talk API."""
-    
+    """HTTP Client for Agent Talk API.
+
+    Holds a single keep-alive connection so repeated API calls reuse the
+    TCP + TLS session instead of paying the handshake cost per request.
+    """
+
     def __init__(self, config: AgentTalkConfig = None):
         if config is None:
             config = AgentTalkConfig()
         self.base_url = config.base_url or DEFAULT_BASE_URL
         self.api_key = config.api_key
-        self.timeout = config.timeout // 1000 if config.timeout else DEFAULT_TIMEOUT
-    
+        self.timeout = config.timeout or DEFAULT_TIMEOUT
+        self._conn: Optional[http.client.HTTPConnection] = None
+        # A base_url may carry a path component (https://host/api);
+        # prefix it onto every request path
+        self._path_prefix = urlsplit(self.base_url).path.rstrip("/")
+
     def get_base_url(self) -> str:
         """Get the base URL."""
         return self.base_url
+
+    def close(self):
+        """Close the underlying HTTP connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Get (or lazily open) the persistent connection."""
+        if self._conn is None:
+            parts = urlsplit(self.base_url)
+            if parts.scheme == "https":
+                self._conn = http.client.HTTPSConnection(parts.netloc, timeout=self.timeout)
+            else:
+                self._conn = http.client.HTTPConnection(parts.netloc, timeout=self.timeout)
+        return self._conn
     
     def get(self, path: str, auth: bool = True) -> dict:
         """Make a GET request."""
@@ -51,63 +86,77 @@ class HttpClient:
         auth: bool = True
     ) -> dict:
         """Make an HTTP request."""
-        url = f"{self.base_url}{path}"
-        
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
-        
+
         # Add API key authentication if required and available
         if auth and self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
-        
+
         data = None
         if body:
-            data = json.dumps(body).encode("utf-8")
-        
-        request = urllib.request.Request(
-            url,
-            data=data,
-            headers=headers,
-            method=method
-        )
-        
+            data = _dumps(body)
+
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                response_body = response.read().decode("utf-8")
-                if not response_body:
-                    return {}
-                return json.loads(response_body)
-        
-        except urllib.error.HTTPError as e:
-            # Handle error response
-            response_body = e.read().decode("utf-8")
-            try:
-                error_response = json.loads(response_body)
-                raise create_error_from_response(e.code, error_response)
-            except json.JSONDecodeError:
-                raise AgentTalkError(
-                    "INTERNAL_ERROR",
-                    f"HTTP {e.code}: {e.reason}",
-                    e.code
-                )
-        
-        except urllib.error.URLError as e:
-            # Handle network errors
+            response = self._send(method, path, data, headers)
+            # Keep the raw bytes: both json.loads and orjson.loads take
+            # bytes, so decoding to str here would be a wasted pass
+            response_body = response.read()
+
+        except (socket.timeout, TimeoutError):
+            # The connection is stuck mid-request; drop it so the next
+            # call reconnects instead of failing with CannotSendRequest
+            self.close()
             raise AgentTalkError(
                 "SERVICE_UNAVAILABLE",
-                f"Network error: Unable to connect to Agent Talk API: {e.reason}",
-                503
+                "Request timeout",
+                408
             )
-        
-        except TimeoutError:
+
+        except (http.client.HTTPException, OSError) as e:
+            # Handle network errors
+            self.close()
             raise AgentTalkError(
                 "SERVICE_UNAVAILABLE",
-                "Request timeout",
-                408
+                f"Network error: Unable to connect to Agent Talk API: {e}",
+                503
             )
 
+        if response.status >= 400:
+            # Handle error response
+            try:
+                error_response = _loads(response_body)
+            except ValueError:
+                raise AgentTalkError(
+                    "INTERNAL_ERROR",
+                    f"HTTP {response.status}: {response.reason}",
+                    response.status
+                )
+            raise create_error_from_response(response.status, error_response)
+
+        if not response_body:
+            return {}
+        return _loads(response_body)
+
+    def _send(self, method: str, path: str, data: Optional[bytes], headers: dict):
+        """Send a request on the persistent connection.
+
+        Retries once on a fresh connection if the server closed the
+        keep-alive session between calls.
+        """
+        full_path = self._path_prefix + path
+        conn = self._get_connection()
+        try:
+            conn.request(method, full_path, body=data, headers=headers)
+            return conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            self.close()
+            conn = self._get_connection()
+            conn.request(method, full_path, body=data, headers=headers)
+            return conn.getresponse()
+
 
 class MemoApi:
     """Memo API - Create and manage text-to-speech memos."""
@@ -140,25 +189,25 @@ class MemoApi:
             )
             print(f"Audio URL: {memo.audio.url}")
         """
-        from .types import Memo, MemoAudio, MemoVoice
+        from .types import Memo
         
         response = self._client.post("/api/v1/memo", {"text": text, "voice": voice}, auth=True)
         
+        voice_data = response["voice"]
+        audio_data = response["audio"]
+        # Positional args in Memo field order: skips kwarg binding on
+        # the per-memo hot path
         return Memo(
-            id=response["id"],
-            text=response["text"],
-            voice=MemoVoice(
-                id=response["voice"]["id"],
-                name=response["voice"]["name"],
-                gender=response["voice"]["gender"],
-                description=response["voice"]["description"]
-            ),
-            audio=MemoAudio(
-                url=response["audio"]["url"],
-                duration=response["audio"]["duration"],
-                format=response["audio"]["format"]
-            ),
-            created_at=response["createdAt"]
+            response["id"],
+            response["text"],
+            voice_data["id"],
+            voice_data["name"],
+            voice_data["gender"],
+            voice_data["description"],
+            audio_data["url"],
+            audio_data["duration"],
+            audio_data["format"],
+            response["createdAt"]
         )
     
     def demo(self, text: str, voice: str) -> 'Memo':
@@ -182,80 +231,96 @@ class MemoApi:
                 voice="rachel"
             )
         """
-        from .types import Memo, MemoAudio, MemoVoice
+        from .types import Memo
         
         response = self._client.post("/api/v1/demo", {"text": text, "voice": voice}, auth=False)
         
+        voice_data = response["voice"]
+        audio_data = response["audio"]
+        # Positional args in Memo field order: skips kwarg binding on
+        # the per-memo hot path
         return Memo(
-            id=response["id"],
-            text=response["text"],
-            voice=MemoVoice(
-                id=response["voice"]["id"],
-                name=response["voice"]["name"],
-                gender=response["voice"]["gender"],
-                description=response["voice"]["description"]
-            ),
-            audio=MemoAudio(
-                url=response["audio"]["url"],
-                duration=response["audio"]["duration"],
-                format=response["audio"]["format"]
-            ),
-            created_at=response["createdAt"]
+            response["id"],
+            response["text"],
+            voice_data["id"],
+            voice_data["name"],
+            voice_data["gender"],
+            voice_data["description"],
+            audio_data["url"],
+            audio_data["duration"],
+            audio_data["format"],
+            response["createdAt"]
         )
 
 
 class VoicesApi:
     """Voices API - List and manage available voices."""
-    
+
     def __init__(self, client: HttpClient):
         self._client = client
-    
+        # (fetched_at, {voice_id: Voice}) - populated by list()
+        self._voices_cache = None
+
     def list(self) -> list:
         """
         List all available voices.
-        
+
+        Results are cached in-process for VOICES_CACHE_TTL seconds;
+        call invalidate() to force a refetch.
+
         Returns:
             List[Voice]: Array of available voices
-        
+
         Example:
             voices = client.voices.list()
             for voice in voices:
                 print(f"{voice.id}: {voice.name} - {voice.description}")
         """
         from .types import Voice
-        
+
+        if (
+            self._voices_cache is not None
+            and time.monotonic() - self._voices_cache[0] < VOICES_CACHE_TTL
+        ):
+            return list(self._voices_cache[1].values())
+
         response = self._client.get("/api/v1/voices", auth=False)
-        
-        return [
-            Voice(
-                id=v["id"],
-                name=v["name"],
-                gender=v["gender"],
-                description=v["description"]
-            )
+
+        voices = [
+            Voice(v["id"], v["name"], v["gender"], v["description"])
             for v in response["voices"]
         ]
-    
+        self._voices_cache = (time.monotonic(), {v.id: v for v in voices})
+        return voices
+
     def get(self, voice_id: str) -> Optional['Voice']:
         """
         Get a voice by ID.
-        
+
+        Served from the cached voice list when fresh, so repeated
+        lookups don't each cost a network round-trip.
+
         Args:
             voice_id: The voice ID to look up
-        
+
         Returns:
             Voice: The voice if found, or None
-        
+
         Example:
             voice = client.voices.get("rachel")
             if voice:
                 print(f"Found voice: {voice.name}")
         """
-        voices = self.list()
-        for voice in voices:
-            if voice.id == voice_id:
-                return voice
-        return None
+        if (
+            self._voices_cache is None
+            or time.monotonic() - self._voices_cache[0] >= VOICES_CACHE_TTL
+        ):
+            self.list()
+        return self._voices_cache[1].get(voice_id)
+
+    def invalidate(self):
+        """Drop the cached voice list so the next call refetches."""
+        self._voices_cache = None
 
 
 class AgentTalk:
@@ -296,22 +361,25 @@ class AgentTalk:
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        timeout: Optional[int] = None
+        timeout: Optional[float] = None
     ):
         """
         Create a new Agent Talk client.
-        
+
         Args:
             api_key: API key (required for memo.create(), optional for demo/voices)
             base_url: API base URL (default: https://talk.onhyper.io)
-            timeout: Request timeout in milliseconds (default: 30000)
+            timeout: Request timeout in seconds (default: 30)
         """
         config = AgentTalkConfig(
             api_key=api_key,
             base_url=base_url or DEFAULT_BASE_URL,
-            timeout=timeout or 30000
+            timeout=timeout or DEFAULT_TIMEOUT
         )
         self._client = HttpClient(config)
+        # Direct attribute for hot-path callers; get_base_url() remains
+        # as a back-compat alias
+        self.base_url = self._client.base_url
         self.memo = MemoApi(self._client)
         self.voices = VoicesApi(self._client)
     
@@ -328,15 +396,26 @@ class AgentTalk:
         """
         response = self._client.get("/health", auth=False)
         
+        db = response.get("database") or {}
         return HealthResponse(
-            status=response["status"],
-            service=response["service"],
-            version=response["version"],
-            timestamp=response["timestamp"],
-            tts_mode=response["ttsMode"],
-            database=response["database"]
+            response["status"],
+            response["service"],
+            response["version"],
+            response["timestamp"],
+            response["ttsMode"],
+            DatabaseHealth(db.get("status", "unknown"), db.get("latency"), db.get("error"))
         )
     
     def get_base_url(self) -> str:
-        """Get the base URL being used."""
-        return self._client.get_base_url()
\ No newline at end of file
+        """Get the base URL being used (alias for the base_url attribute)."""
+        return self.base_url
+
+    def close(self):
+        """Close the underlying HTTP connection."""
+        self._client.close()
+
+    def __enter__(self) -> 'AgentTalk':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
\ No newline at end of file
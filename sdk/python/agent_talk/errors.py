@@ -8,7 +8,9 @@ from .types import ErrorDetails
 
 class AgentTalkError(Exception):
     """Base error class for all Agent Talk errors."""
-    
+
+    __slots__ = ('code', 'message', 'status_code', 'details', 'name')
+
     def __init__(
         self,
         code: str,
@@ -26,7 +28,9 @@ class AgentTalkError(Exception):
 
 class ValidationError(AgentTalkError):
     """Validation error (400)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[ErrorDetails] = None):
         super().__init__("VALIDATION_ERROR", message, 400, details)
         self.name = "ValidationError"
@@ -34,7 +38,9 @@ class ValidationError(AgentTalkError):
 
 class InvalidInputError(AgentTalkError):
     """Invalid input error (400)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, field: str, reason: str, provided_type: Optional[str] = None):
         details = ErrorDetails(field=field, reason=reason, provided_type=provided_type)
         super().__init__("INVALID_INPUT", f"Invalid {field}: {reason}", 400, details)
@@ -43,7 +49,9 @@ class InvalidInputError(AgentTalkError):
 
 class MissingFieldError(AgentTalkError):
     """Missing required field error (400)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, field: str):
         details = ErrorDetails(field=field)
         super().__init__("MISSING_FIELD", f"Missing required field: {field}", 400, details)
@@ -52,12 +60,15 @@ class MissingFieldError(AgentTalkError):
 
 class InvalidVoiceError(AgentTalkError):
     """Invalid voice ID error (400)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, requested_voice: str, available_voices: list):
         details = ErrorDetails(
             field="voice",
             requested_voice=requested_voice,
-            available_voices=available_voices
+            # frozenset so "voice in details.available_voices" is a hash probe
+            available_voices=frozenset(available_voices)
         )
         super().__init__("INVALID_VOICE", f"Invalid voice: \"{requested_voice}\"", 400, details)
         self.name = "InvalidVoiceError"
@@ -65,7 +76,9 @@ class InvalidVoiceError(AgentTalkError):
 
 class UnauthorizedError(AgentTalkError):
     """Authentication required error (401)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication required"):
         super().__init__("UNAUTHORIZED", message, 401)
         self.name = "UnauthorizedError"
@@ -73,7 +86,9 @@ class UnauthorizedError(AgentTalkError):
 
 class MissingApiKeyError(AgentTalkError):
     """API key required error (401)."""
-    
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("MISSING_API_KEY", "API key is required", 401)
         self.name = "MissingApiKeyError"
@@ -81,7 +96,9 @@ class MissingApiKeyError(AgentTalkError):
 
 class InvalidApiKeyError(AgentTalkError):
     """Invalid API key error (401)."""
-    
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("INVALID_API_KEY", "Invalid API key", 401)
         self.name = "InvalidApiKeyError"
@@ -89,7 +106,9 @@ class InvalidApiKeyError(AgentTalkError):
 
 class ExpiredTokenError(AgentTalkError):
     """Expired token error (401)."""
-    
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("EXPIRED_TOKEN", "Token has expired", 401)
         self.name = "ExpiredTokenError"
@@ -97,7 +116,9 @@ class ExpiredTokenError(AgentTalkError):
 
 class ForbiddenError(AgentTalkError):
     """Access denied error (403)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Access denied"):
         super().__init__("FORBIDDEN", message, 403)
         self.name = "ForbiddenError"
@@ -105,7 +126,9 @@ class ForbiddenError(AgentTalkError):
 
 class InsufficientTierError(AgentTalkError):
     """Insufficient tier error (403)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, required_tier: str, current_tier: str):
         details = ErrorDetails(required_tier=required_tier, current_tier=current_tier)
         super().__init__("INSUFFICIENT_TIER", f"This feature requires {required_tier} tier", 403, details)
@@ -114,7 +137,9 @@ class InsufficientTierError(AgentTalkError):
 
 class RevokedKeyError(AgentTalkError):
     """Revoked API key error (403)."""
-    
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("REVOKED_KEY", "API key has been revoked", 403)
         self.name = "RevokedKeyError"
@@ -122,7 +147,9 @@ class RevokedKeyError(AgentTalkError):
 
 class NotFoundError(AgentTalkError):
     """Resource not found error (404)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, resource: str = "Resource"):
         super().__init__("NOT_FOUND", f"{resource} not found", 404)
         self.name = "NotFoundError"
@@ -130,7 +157,9 @@ class NotFoundError(AgentTalkError):
 
 class MemoNotFoundError(AgentTalkError):
     """Memo not found error (404)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, memo_id: str):
         details = ErrorDetails(memo_id=memo_id)
         super().__init__("MEMO_NOT_FOUND", "Memo not found", 404, details)
@@ -139,7 +168,9 @@ class MemoNotFoundError(AgentTalkError):
 
 class RateLimitError(AgentTalkError):
     """Rate limit exceeded error (429)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Rate limit exceeded"):
         super().__init__("RATE_LIMIT_EXCEEDED", message, 429)
         self.name = "RateLimitError"
@@ -147,7 +178,9 @@ class RateLimitError(AgentTalkError):
 
 class DailyLimitExceededError(AgentTalkError):
     """Daily rate limit exceeded error (429)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, limit: int, used: int, reset_at: str):
         details = ErrorDetails(limit=limit, used=used, reset_at=reset_at)
         super().__init__("DAILY_LIMIT_EXCEEDED", "Daily rate limit exceeded", 429, details)
@@ -156,7 +189,9 @@ class DailyLimitExceededError(AgentTalkError):
 
 class MonthlyLimitExceededError(AgentTalkError):
     """Monthly rate limit exceeded error (429)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, limit: int, used: int, reset_at: str):
         details = ErrorDetails(limit=limit, used=used, reset_at=reset_at)
         super().__init__("MONTHLY_LIMIT_EXCEEDED", "Monthly rate limit exceeded", 429, details)
@@ -165,7 +200,9 @@ class MonthlyLimitExceededError(AgentTalkError):
 
 class InternalError(AgentTalkError):
     """Internal server error (500)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Internal server error"):
         super().__init__("INTERNAL_ERROR", message, 500)
         self.name = "InternalError"
@@ -173,7 +210,9 @@ class InternalError(AgentTalkError):
 
 class TTSServiceError(AgentTalkError):
     """Text-to-speech service error (500)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Text-to-speech service error"):
         super().__init__("TTS_SERVICE_ERROR", message, 500)
         self.name = "TTSServiceError"
@@ -181,7 +220,9 @@ class TTSServiceError(AgentTalkError):
 
 class StorageError(AgentTalkError):
     """Storage operation failed error (500)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, operation: str):
         details = ErrorDetails(operation=operation)
         super().__init__("STORAGE_ERROR", "Storage operation failed", 500, details)
@@ -190,7 +231,9 @@ class StorageError(AgentTalkError):
 
 class NotImplementedError(AgentTalkError):
     """Feature not implemented error (501)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, feature: str):
         super().__init__("NOT_IMPLEMENTED", f"{feature} is not implemented", 501)
         self.name = "NotImplementedError"
@@ -198,80 +241,103 @@ class NotImplementedError(AgentTalkError):
 
 class ServiceUnavailableError(AgentTalkError):
     """Service unavailable error (503)."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Service unavailable"):
         super().__init__("SERVICE_UNAVAILABLE", message, 503)
         self.name = "ServiceUnavailableError"
 
 
+_DETAIL_FIELDS = frozenset(ErrorDetails._fields)
+
+
+def _snake_case(key: str) -> str:
+    """Convert a camelCase API key to snake_case."""
+    return ''.join('_' + c.lower() if c.isupper() else c for c in key)
+
+
+def _parse_details(details_data: dict) -> Optional[ErrorDetails]:
+    """Build ErrorDetails from API details, ignoring unknown fields."""
+    if not details_data:
+        return None
+    return ErrorDetails(**{k: v for k, v in details_data.items() if k in _DETAIL_FIELDS})
+
+
+# Error-code -> factory dispatch, built once at import time. Each factory
+# takes (message, details_data, status_code) with details keys already
+# snake_cased.
+_ERROR_FACTORIES = {
+    # Validation errors
+    "VALIDATION_ERROR": lambda msg, d, sc: ValidationError(msg, _parse_details(d)),
+    "INVALID_INPUT": lambda msg, d, sc: InvalidInputError(
+        d.get("field", "unknown"),
+        d.get("reason", msg),
+        d.get("provided_type")
+    ),
+    "MISSING_FIELD": lambda msg, d, sc: MissingFieldError(d.get("field", "unknown")),
+    "INVALID_VOICE": lambda msg, d, sc: InvalidVoiceError(
+        d.get("requested_voice", ""),
+        d.get("available_voices", [])
+    ),
+
+    # Authentication errors
+    "UNAUTHORIZED": lambda msg, d, sc: UnauthorizedError(msg),
+    "MISSING_API_KEY": lambda msg, d, sc: MissingApiKeyError(),
+    "INVALID_API_KEY": lambda msg, d, sc: InvalidApiKeyError(),
+    "EXPIRED_TOKEN": lambda msg, d, sc: ExpiredTokenError(),
+
+    # Authorization errors
+    "FORBIDDEN": lambda msg, d, sc: ForbiddenError(msg),
+    "INSUFFICIENT_TIER": lambda msg, d, sc: InsufficientTierError(
+        d.get("required_tier", ""),
+        d.get("current_tier", "")
+    ),
+    "REVOKED_KEY": lambda msg, d, sc: RevokedKeyError(),
+
+    # Not found errors
+    "NOT_FOUND": lambda msg, d, sc: NotFoundError(msg),
+    "MEMO_NOT_FOUND": lambda msg, d, sc: MemoNotFoundError(d.get("memo_id", "")),
+
+    # Rate limiting errors
+    "RATE_LIMIT_EXCEEDED": lambda msg, d, sc: RateLimitError(msg),
+    "DAILY_LIMIT_EXCEEDED": lambda msg, d, sc: DailyLimitExceededError(
+        d.get("limit", 0),
+        d.get("used", 0),
+        d.get("reset_at", "")
+    ),
+    "MONTHLY_LIMIT_EXCEEDED": lambda msg, d, sc: MonthlyLimitExceededError(
+        d.get("limit", 0),
+        d.get("used", 0),
+        d.get("reset_at", "")
+    ),
+
+    # Server errors
+    "INTERNAL_ERROR": lambda msg, d, sc: InternalError(msg),
+    "TTS_SERVICE_ERROR": lambda msg, d, sc: TTSServiceError(msg),
+    "STORAGE_ERROR": lambda msg, d, sc: StorageError(d.get("operation", "unknown")),
+
+    # Not implemented
+    "NOT_IMPLEMENTED": lambda msg, d, sc: NotImplementedError(msg),
+
+    # Service unavailable
+    "SERVICE_UNAVAILABLE": lambda msg, d, sc: ServiceUnavailableError(msg),
+}
+
+
 def create_error_from_response(status_code: int, error_response: dict) -> AgentTalkError:
     """Create appropriate error from API response."""
     error_data = error_response.get("error", {})
     code = error_data.get("code", "INTERNAL_ERROR")
     message = error_data.get("message", "Unknown error")
     details_data = error_data.get("details", {})
-    
-    details = ErrorDetails(**details_data) if details_data else None
-    
-    error_map = {
-        # Validation errors
-        "VALIDATION_ERROR": lambda: ValidationError(message, details),
-        "INVALID_INPUT": lambda: InvalidInputError(
-            details_data.get("field", "unknown"),
-            details_data.get("reason", message),
-            details_data.get("provided_type")
-        ),
-        "MISSING_FIELD": lambda: MissingFieldError(details_data.get("field", "unknown")),
-        "INVALID_VOICE": lambda: InvalidVoiceError(
-            details_data.get("requested_voice", ""),
-            details_data.get("available_voices", [])
-        ),
-        
-        # Authentication errors
-        "UNAUTHORIZED": lambda: UnauthorizedError(message),
-        "MISSING_API_KEY": lambda: MissingApiKeyError(),
-        "INVALID_API_KEY": lambda: InvalidApiKeyError(),
-        "EXPIRED_TOKEN": lambda: ExpiredTokenError(),
-        
-        # Authorization errors
-        "FORBIDDEN": lambda: ForbiddenError(message),
-        "INSUFFICIENT_TIER": lambda: InsufficientTierError(
-            details_data.get("required_tier", ""),
-            details_data.get("current_tier", "")
-        ),
-        "REVOKED_KEY": lambda: RevokedKeyError(),
-        
-        # Not found errors
-        "NOT_FOUND": lambda: NotFoundError(message),
-        "MEMO_NOT_FOUND": lambda: MemoNotFoundError(details_data.get("field", "")),
-        
-        # Rate limiting errors
-        "RATE_LIMIT_EXCEEDED": lambda: RateLimitError(message),
-        "DAILY_LIMIT_EXCEEDED": lambda: DailyLimitExceededError(
-            details_data.get("limit", 0),
-            details_data.get("used", 0),
-            details_data.get("reset_at", "")
-        ),
-        "MONTHLY_LIMIT_EXCEEDED": lambda: MonthlyLimitExceededError(
-            details_data.get("limit", 0),
-            details_data.get("used", 0),
-            details_data.get("reset_at", "")
-        ),
-        
-        # Server errors
-        "INTERNAL_ERROR": lambda: InternalError(message),
-        "TTS_SERVICE_ERROR": lambda: TTSServiceError(message),
-        "STORAGE_ERROR": lambda: StorageError(details_data.get("operation", "unknown")),
-        
-        # Not implemented
-        "NOT_IMPLEMENTED": lambda: NotImplementedError(message),
-        
-        # Service unavailable
-        "SERVICE_UNAVAILABLE": lambda: ServiceUnavailableError(message),
-    }
-    
-    error_factory = error_map.get(code)
-    if error_factory:
-        return error_factory()
-    
-    return AgentTalkError(code, message, status_code, details)
\ No newline at end of file
+
+    # The API sends camelCase detail keys; normalize once for the factories
+    if details_data:
+        details_data = {_snake_case(k): v for k, v in details_data.items()}
+
+    factory = _ERROR_FACTORIES.get(code)
+    if factory:
+        return factory(message, details_data, status_code)
+
+    return AgentTalkError(code, message, status_code, _parse_details(details_data))
\ No newline at end of file
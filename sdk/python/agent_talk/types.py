@@ -2,21 +2,34 @@
 Agent Talk SDK - TypeScript Types
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, Literal
-from datetime import datetime
+from typing import NamedTuple, Optional, Literal
 
+# slots=True halves per-instance memory and speeds attribute access, but
+# only exists on Python 3.10+; older interpreters get plain dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Voice:
-    """A TTS voice option."""
+    """A TTS voice option.
+
+    Frozen and therefore hashable, so voices can live in sets and serve
+    as dict keys with a single C-level hash per lookup.
+    """
     id: str
     name: str
     gender: Literal['male', 'female']
     description: str
 
+    def __post_init__(self):
+        # Fixed-cardinality value: interning dedupes the string across
+        # instances and makes equality checks pointer compares
+        object.__setattr__(self, 'gender', sys.intern(self.gender))
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class MemoAudio:
     """Audio metadata for a memo."""
     url: str
@@ -24,7 +37,7 @@ class MemoAudio:
     format: Literal['mp3', 'wav', 'ogg', 'webm']
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MemoVoice:
     """Voice used in a memo."""
     id: str
@@ -33,24 +46,59 @@ class MemoVoice:
     description: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Memo:
-    """A text-to-speech memo."""
+    """A text-to-speech memo.
+
+    Voice and audio metadata are stored inline, so building a memo from
+    JSON allocates one object instead of three. The voice/audio
+    properties expose the nested views for callers written against the
+    old shape.
+    """
     id: str
     text: str
-    voice: MemoVoice
-    audio: MemoAudio
+    voice_id: str
+    voice_name: str
+    voice_gender: Literal['male', 'female']
+    voice_description: str
+    audio_url: str
+    audio_duration: float
+    audio_format: Literal['mp3', 'wav', 'ogg', 'webm']
     created_at: str
 
+    def __post_init__(self):
+        # Fixed-cardinality values: interning dedupes the strings across
+        # instances and makes equality checks pointer compares
+        self.voice_gender = sys.intern(self.voice_gender)
+        self.audio_format = sys.intern(self.audio_format)
+
+    @property
+    def voice(self) -> MemoVoice:
+        """Nested voice view, built on access."""
+        return MemoVoice(self.voice_id, self.voice_name, self.voice_gender, self.voice_description)
+
+    @property
+    def audio(self) -> MemoAudio:
+        """Nested audio view, built on access."""
+        return MemoAudio(self.audio_url, self.audio_duration, self.audio_format)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CreateMemoOptions:
     """Options for creating a memo."""
     text: str
     voice: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class DatabaseHealth:
+    """Database portion of a health check."""
+    status: str
+    latency: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass(**_SLOTS)
 class HealthResponse:
     """Health check response."""
     status: Literal['ok', 'error']
@@ -58,25 +106,33 @@ class HealthResponse:
     version: str
     timestamp: str
     tts_mode: Literal['simulation', 'edge', 'elevenlabs']
-    database: dict
+    database: DatabaseHealth
 
+    def __post_init__(self):
+        self.status = sys.intern(self.status)
+        self.tts_mode = sys.intern(self.tts_mode)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class AgentTalkConfig:
     """Client configuration."""
     api_key: Optional[str] = None
     base_url: str = "https://talk.onhyper.io"
-    timeout: int = 30000
+    timeout: float = 30.0  # seconds
+
 
+class ErrorDetails(NamedTuple):
+    """Details about an error.
 
-@dataclass
-class ErrorDetails:
-    """Details about an error."""
+    A NamedTuple rather than a dataclass: error details are built on the
+    JSON-decode path, and tuple construction skips the per-field setattr
+    cost while keeping attribute access.
+    """
     field: Optional[str] = None
     reason: Optional[str] = None
     provided_type: Optional[str] = None
     requested_voice: Optional[str] = None
-    available_voices: Optional[list] = None
+    available_voices: Optional[frozenset] = None
     limit: Optional[int] = None
     used: Optional[int] = None
     reset_at: Optional[str] = None
@@ -0,0 +1,23 @@
+"""Optional compiled build for the Agent Talk SDK.
+
+The default build is the normal pure-Python wheel (everything comes from
+pyproject.toml). Set AGENT_TALK_COMPILED=1 with Cython installed to also
+compile the hot modules - types.py and errors.py - to C extensions,
+removing interpreter dispatch from dataclass construction and the
+error-decode path. The pure-Python sources stay in the wheel, so imports
+fall back cleanly when the extensions are absent.
+"""
+
+import os
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("AGENT_TALK_COMPILED") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["agent_talk/types.py", "agent_talk/errors.py"],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
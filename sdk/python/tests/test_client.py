@@ -33,49 +33,66 @@ def test_client_initialization_with_custom_url():
     assert client.get_base_url() == "http://localhost:3000"
 
 
-def test_create_error_from_response():
-    """Test error creation from API response."""
-    error_response = {
-        "error": {
-            "code": "INVALID_VOICE",
-            "message": "Invalid voice: invalid",
-            "details": {
-                "requestedVoice": "invalid",
-                "availableVoices": ["rachel", "domi", "adam"]
-            }
+# Error-response bodies for test_error_mapping, built once at module scope
+INVALID_VOICE_RESPONSE = {
+    "error": {
+        "code": "INVALID_VOICE",
+        "message": "Invalid voice: invalid",
+        "details": {
+            "requestedVoice": "invalid",
+            "availableVoices": ["rachel", "domi", "adam"]
         }
     }
-    
-    error = create_error_from_response(400, error_response)
-    assert isinstance(error, InvalidVoiceError)
-    assert error.code == "INVALID_VOICE"
-    assert "invalid" in error.message
+}
+UNKNOWN_CODE_RESPONSE = {
+    "error": {
+        "code": "UNKNOWN_ERROR",
+        "message": "Something went wrong"
+    }
+}
+MISSING_API_KEY_RESPONSE = {
+    "error": {
+        "code": "MISSING_API_KEY",
+        "message": "API key is required"
+    }
+}
 
 
-def test_create_error_from_response_unknown_code():
-    """Test error creation with unknown error code."""
-    error_response = {
-        "error": {
-            "code": "UNKNOWN_ERROR",
-            "message": "Something went wrong"
-        }
-    }
-    
-    error = create_error_from_response(500, error_response)
-    assert isinstance(error, AgentTalkError)
-    assert error.code == "UNKNOWN_ERROR"
-    assert error.message == "Something went wrong"
+@pytest.mark.parametrize("status_code,response,expected_cls,expected_code,expected_message", [
+    (400, INVALID_VOICE_RESPONSE, InvalidVoiceError, "INVALID_VOICE", "invalid"),
+    (500, UNKNOWN_CODE_RESPONSE, AgentTalkError, "UNKNOWN_ERROR", "Something went wrong"),
+    (401, MISSING_API_KEY_RESPONSE, MissingApiKeyError, "MISSING_API_KEY", "API key is required"),
+])
+def test_error_mapping(status_code, response, expected_cls, expected_code, expected_message):
+    """Test error creation from API responses."""
+    error = create_error_from_response(status_code, response)
+    assert isinstance(error, expected_cls)
+    assert error.code == expected_code
+    assert error.status_code == status_code
+    assert expected_message in error.message
 
 
-def test_missing_api_key_error():
-    """Test missing API key error."""
-    error_response = {
+def test_error_dispatch_table():
+    """Test that error codes dispatch through the module-level table."""
+    from agent_talk.errors import _ERROR_FACTORIES, DailyLimitExceededError, RateLimitError
+
+    assert "RATE_LIMIT_EXCEEDED" in _ERROR_FACTORIES
+
+    error = create_error_from_response(429, {
         "error": {
-            "code": "MISSING_API_KEY",
-            "message": "API key is required"
+            "code": "DAILY_LIMIT_EXCEEDED",
+            "message": "Daily rate limit exceeded",
+            "details": {"limit": 100, "used": 100, "resetAt": "2026-01-01T00:00:00Z"}
         }
-    }
-    
-    error = create_error_from_response(401, error_response)
-    assert isinstance(error, MissingApiKeyError)
-    assert error.status_code == 401
\ No newline at end of file
+    })
+    assert isinstance(error, DailyLimitExceededError)
+    assert error.details.limit == 100
+    assert error.details.reset_at == "2026-01-01T00:00:00Z"
+
+    error = create_error_from_response(429, {
+        "error": {"code": "RATE_LIMIT_EXCEEDED", "message": "Slow down"}
+    })
+    assert isinstance(error, RateLimitError)
+    assert error.message == "Slow down"
+
+